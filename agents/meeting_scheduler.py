@@ -38,7 +38,7 @@ class MeetingScheduler:
         # Default meeting duration (30 minutes)
         self.default_duration = 30
     
-    def analyze_request(self, request_data: Dict[str, Any], lead_context: Dict[str, Any]) -> Dict[str, Any]:
+    def analyze_request(self, request_data: Dict[str, Any], lead_context: Dict[str, Any], llm_chain: Any = None) -> Dict[str, Any]:
         """Analyze a meeting request to determine intent and scheduling approach.
         
         Analyzes the meeting request content to understand the lead's preferences,
@@ -52,6 +52,8 @@ class MeetingScheduler:
                          - meeting_type: Type of meeting requested
                          - lead_id: ID of the requesting lead
             lead_context: Dictionary containing lead background information
+            llm_chain: Optional pre-built chain exposing run(**inputs); when omitted
+                      a chain is created from the agent core
         
         Returns:
             Dict containing analysis results:
@@ -80,9 +82,11 @@ class MeetingScheduler:
             # Build prompt for analysis
             prompt = self._build_request_prompt(request_data, context)
             
-            # Create LLM chain
-            input_variables = ["request_text", "sender_email", "lead_context", "preferred_times"]
-            chain = self.agent_core.create_llm_chain(prompt, input_variables)
+            # Create LLM chain unless the caller supplied one
+            chain = llm_chain
+            if chain is None:
+                input_variables = ["request_text", "sender_email", "lead_context", "preferred_times"]
+                chain = self.agent_core.create_llm_chain(prompt, input_variables)
             
             # Run analysis
             response = chain.run(
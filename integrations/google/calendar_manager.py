@@ -71,6 +71,23 @@ class CalendarManager(GoogleAPICore):
             print(f"An error occurred: {error}")
             return []
 
+    def get_busy_intervals(self, start: datetime.datetime, end: datetime.datetime) -> list[tuple[datetime.datetime, datetime.datetime]]:
+        """
+        Return the (start, end) intervals of timed events between start and end, sorted by start,
+        from a single events query. All-day events are ignored, as in is_time_slot_free.
+        """
+        intervals = []
+        for event in self.get_events_in_range(start, end):
+            event_start = event["start"].get("dateTime")
+            event_end = event["end"].get("dateTime")
+            if event_start and event_end:
+                intervals.append((
+                    datetime.datetime.fromisoformat(event_start),
+                    datetime.datetime.fromisoformat(event_end),
+                ))
+        intervals.sort()
+        return intervals
+
     def is_time_slot_free(self, start: datetime.datetime, end: datetime.datetime) -> bool:
         """
         Return True if the time slot is free (no overlapping events).
@@ -81,8 +98,8 @@ class CalendarManager(GoogleAPICore):
             event_start = event["start"].get("dateTime")
             event_end = event["end"].get("dateTime")
             if event_start and event_end:
-                event_start_dt = datetime.datetime.fromisoformat(event_start.replace("Z", "+00:00"))
-                event_end_dt = datetime.datetime.fromisoformat(event_end.replace("Z", "+00:00"))
+                event_start_dt = datetime.datetime.fromisoformat(event_start)
+                event_end_dt = datetime.datetime.fromisoformat(event_end)
                 if not (end <= event_start_dt or start >= event_end_dt):
                     return False
         return True
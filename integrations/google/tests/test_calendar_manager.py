@@ -29,4 +29,27 @@ def test_list_upcoming_events_no_events(mock_get_service, capsys):
     events = manager.list_upcoming_events(max_results=2)
     assert events == []
     captured = capsys.readouterr()
-    assert "No upcoming events found." in captured.out 
\ No newline at end of file
+    assert "No upcoming events found." in captured.out 
+
+@patch("integrations.google.calendar_manager.GoogleAPICore._get_service")
+def test_get_busy_intervals_sorted_and_skips_all_day(mock_get_service):
+    import datetime
+    mock_service = MagicMock()
+    mock_events = [
+        {"start": {"dateTime": "2024-06-03T15:00:00Z"}, "end": {"dateTime": "2024-06-03T15:30:00Z"}},
+        {"start": {"date": "2024-06-03"}, "end": {"date": "2024-06-04"}},
+        {"start": {"dateTime": "2024-06-03T13:00:00Z"}, "end": {"dateTime": "2024-06-03T14:00:00Z"}},
+    ]
+    mock_service.events.return_value.list.return_value.execute.return_value = {"items": mock_events}
+    mock_get_service.return_value = mock_service
+
+    manager = CalendarManager()
+    utc = datetime.timezone.utc
+    intervals = manager.get_busy_intervals(
+        datetime.datetime(2024, 6, 3, tzinfo=utc), datetime.datetime(2024, 6, 4, tzinfo=utc)
+    )
+    assert intervals == [
+        (datetime.datetime(2024, 6, 3, 13, tzinfo=utc), datetime.datetime(2024, 6, 3, 14, tzinfo=utc)),
+        (datetime.datetime(2024, 6, 3, 15, tzinfo=utc), datetime.datetime(2024, 6, 3, 15, 30, tzinfo=utc)),
+    ]
+    mock_service.events.return_value.list.assert_called_once()
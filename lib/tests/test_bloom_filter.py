@@ -0,0 +1,29 @@
+import pytest
+from lib.bloom_filter import BloomFilter
+
+
+def test_added_items_are_always_members():
+    bloom = BloomFilter(capacity=100, error_rate=0.001)
+    domains = [f"company{i}.com" for i in range(100)]
+    for domain in domains:
+        bloom.add(domain)
+    assert all(domain in bloom for domain in domains)
+
+
+def test_false_positive_rate_stays_near_error_rate():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    for i in range(1000):
+        bloom.add(f"known{i}.com")
+    false_positives = sum(f"unknown{i}.com" in bloom for i in range(10000))
+    assert false_positives / 10000 < 0.03
+
+
+def test_empty_filter_has_no_members():
+    bloom = BloomFilter(capacity=10)
+    assert "acmecorp.com" not in bloom
+
+
+@pytest.mark.parametrize("capacity,error_rate", [(0, 0.01), (10, 0), (10, 1)])
+def test_invalid_parameters_raise(capacity, error_rate):
+    with pytest.raises(ValueError):
+        BloomFilter(capacity=capacity, error_rate=error_rate)
@@ -49,10 +49,7 @@ class MemoryManager:
         import uuid
         lead_id = f"lead_{uuid.uuid4().hex[:12]}"
         print(f"[DEBUG] get_or_create_lead_id creating new lead_id: {lead_id} for email: {email}")
-        data = lead_data.copy()
-        data["lead_id"] = lead_id
-        data["email"] = email
-        self.save_lead(lead_id, data)
+        self.save_lead(lead_id, lead_data | {"lead_id": lead_id, "email": email})
         return lead_id
     
     # Qualification operations
@@ -61,8 +58,13 @@ class MemoryManager:
         # Ensure lead exists
         if not self.get_lead(lead_id):
             self.save_lead(lead_id, {"name": "Unknown", "email": "unknown@example.com"})
+        self.store.execute_insert(*self._qualification_insert(lead_id, qualification_data))
+    
+    @staticmethod
+    def _qualification_insert(lead_id: str, qualification_data: Dict[str, Any]) -> tuple:
+        """Build the INSERT query and parameters for a new qualification record."""
         now = datetime.now().isoformat()
-        self.store.execute_insert(
+        return (
             "INSERT INTO lead_qualifications (lead_id, priority, lead_score, reasoning, next_action, "
             "lead_disposition, disposition_confidence, sentiment, urgency, last_reply_analysis, "
             "recommended_follow_up, follow_up_timing, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
@@ -97,6 +99,20 @@ class MemoryManager:
         """Check if a lead has been qualified before."""
         return self.get_latest_qualification(lead_id) is not None
     
+    def record_meeting_qualification(self, lead_id: str, updates: Dict[str, Any], interaction_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Merge updates into the lead's qualification and log a meeting_scheduled interaction,
+        writing both in one transaction. Returns the merged qualification that was saved.
+        """
+        if not self.get_lead(lead_id):
+            self.save_lead(lead_id, {"name": "Unknown", "email": "unknown@example.com"})
+        qualification = (self.get_qualification(lead_id) or {}) | updates
+        self.store.execute_batch([
+            self._qualification_insert(lead_id, qualification),
+            self._interaction_insert(lead_id, "meeting_scheduled", interaction_data)
+        ])
+        return qualification
+    
     # Meeting operations
     def save_meeting(self, lead_id: str, meeting_data: Dict[str, Any]) -> int:
         """Save meeting information for a lead."""
@@ -109,9 +125,7 @@ class MemoryManager:
         
         if existing:
             # Update existing meeting
-            data = existing.copy()
-            data.update(meeting_data)
-            data["updated_at"] = datetime.now().isoformat()
+            data = existing | meeting_data | {"updated_at": datetime.now().isoformat()}
             
             self.store.execute_update(
                 "UPDATE meetings SET meeting_status=?, meeting_datetime=?, meeting_type=?, "
@@ -187,7 +201,12 @@ class MemoryManager:
     # Interaction operations
     def add_interaction(self, lead_id: str, event_type: str, event_data: Dict[str, Any]) -> int:
         """Add an interaction to the history."""
-        return self.store.execute_insert(
+        return self.store.execute_insert(*self._interaction_insert(lead_id, event_type, event_data))
+    
+    @staticmethod
+    def _interaction_insert(lead_id: str, event_type: str, event_data: Dict[str, Any]) -> tuple:
+        """Build the INSERT query and parameters for an interaction."""
+        return (
             "INSERT INTO interactions (lead_id, event_type, event_data) VALUES (?, ?, ?)",
             (lead_id, event_type, json.dumps(event_data))
         )
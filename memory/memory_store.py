@@ -1,7 +1,7 @@
 """Memory store with star schema design."""
 import sqlite3
 import os
-from typing import Dict, Optional, Any, List
+from typing import Dict, Optional, Any, List, Tuple
 
 class SQLiteMemoryStore:
     """Generic SQLite-based memory store with star schema design."""
@@ -129,6 +129,13 @@ class SQLiteMemoryStore:
             conn.commit()
             return cursor.lastrowid
     
+    def execute_batch(self, statements: List[Tuple[str, tuple]]) -> List[int]:
+        """Execute several write queries in one transaction and return each last row ID."""
+        with sqlite3.connect(self.db_path) as conn:
+            row_ids = [conn.execute(query, params).lastrowid for query, params in statements]
+            conn.commit()
+            return row_ids
+    
     def execute_update(self, query: str, params: tuple = ()) -> int:
         """Execute an UPDATE query and return the number of affected rows."""
         with sqlite3.connect(self.db_path) as conn:
@@ -175,4 +175,29 @@ def test_qualification_history_inserts():
         assert history[0]["lead_score"] == 85
         assert history[1]["lead_score"] == 99
     finally:
-        os.remove(db_path) 
\ No newline at end of file
+        os.remove(db_path) 
+
+
+def test_record_meeting_qualification_writes_qualification_and_interaction():
+    mgr, db_path = fresh_manager()
+    try:
+        lead_id = "lead_meeting"
+        mgr.save_qualification(lead_id, {
+            "priority": "low", "lead_score": 40, "reasoning": "Cold inbound",
+            "next_action": "Nurture", "sentiment": "neutral"
+        })
+        saved = mgr.record_meeting_qualification(
+            lead_id,
+            {"priority": "high", "lead_score": 95, "reasoning": "Booked pricing review", "next_action": "Present pricing"},
+            {"meeting_type": "Pricing Review"}
+        )
+        assert saved["lead_score"] == 95
+        assert saved["sentiment"] == "neutral"
+        qual = mgr.get_qualification(lead_id)
+        assert qual["priority"] == "high"
+        assert qual["sentiment"] == "neutral"
+        history = mgr.get_interaction_history(lead_id)
+        assert [h["event_type"] for h in history] == ["meeting_scheduled"]
+        assert history[0]["event_data"] == {"meeting_type": "Pricing Review"}
+    finally:
+        os.remove(db_path)
@@ -150,7 +150,27 @@ Next Action: Confirm the demo for either 9:00 AM or 10:00 AM
         self.assertIn("meeting_type", result)
         self.assertEqual(result["intent"], "schedule_meeting")
         self.assertEqual(result["urgency"], "high")
-    
+
+    @patch('agents.agent_core.AgentCore.create_llm_chain')
+    def test_analyze_meeting_request_uses_injected_chain(self, mock_create_chain):
+        """Test that analyze_meeting_request runs a supplied chain instead of building one."""
+        injected_chain = MagicMock()
+        injected_chain.run.return_value = """
+Intent: schedule_meeting
+Urgency: low
+Meeting Type: consultation
+Next Action: propose_times
+        """
+
+        request_data = mock_meeting_requests["meeting_001"]
+        context = build_context_from_meeting_request(request_data, self.memory_manager)
+        result = analyze_meeting_request(context, llm_chain=injected_chain)
+
+        mock_create_chain.assert_not_called()
+        injected_chain.run.assert_called_once()
+        self.assertEqual(result["urgency"], "low")
+        self.assertEqual(result["meeting_type"], "consultation")
+
     def test_build_context_from_meeting_request(self):
         """Test building context from meeting request data."""
         request_data = mock_meeting_requests["meeting_001"]
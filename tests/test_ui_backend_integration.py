@@ -370,6 +370,36 @@ Sales Team""",
         self.assertTrue(len(interactions) >= 1)
         self.assertEqual(interactions[0]["event_type"], "email_sent")
 
+    def test_latest_demo_result_tracks_most_recent_store(self):
+        """Test the latest demo result follows store order, not lead_id ordering."""
+        import streamlit as st
+        from ui.state.session import get_latest_demo_result, store_demo_result
+
+        st.session_state.demo_results = {}
+        self.assertIsNone(get_latest_demo_result("meeting"))
+
+        store_demo_result("meeting", "lead_b", {"n": 1})
+        store_demo_result("meeting", "lead_a", {"n": 2})
+        self.assertEqual(get_latest_demo_result("meeting"), ("lead_a", {"n": 2}))
+
+        # Re-storing an existing lead moves it to the front
+        store_demo_result("meeting", "lead_b", {"n": 3})
+        self.assertEqual(get_latest_demo_result("meeting"), ("lead_b", {"n": 3}))
+
+    def test_demo_results_are_bounded_per_tab(self):
+        """Test that storing demo results evicts the oldest beyond the per-tab cap."""
+        import streamlit as st
+        from ui.state.session import MAX_DEMO_RESULTS_PER_TAB, store_demo_result
+
+        st.session_state.demo_results = {}
+        for i in range(MAX_DEMO_RESULTS_PER_TAB + 5):
+            store_demo_result("meeting", f"lead_{i}", {"n": i})
+
+        results = st.session_state.demo_results["meeting"]
+        self.assertEqual(len(results), MAX_DEMO_RESULTS_PER_TAB)
+        self.assertNotIn("lead_0", results)
+        self.assertIn(f"lead_{MAX_DEMO_RESULTS_PER_TAB + 4}", results)
+
     def test_no_get_llm_chain_attribute_error_on_qualification(self):
         """Ensure no AttributeError for get_llm_chain occurs during qualification workflow."""
         form_data = {
@@ -981,6 +1011,93 @@ Sales Team""",
             print("Interaction history after both meetings:", interactions)
             self.assertTrue(len(interactions) >= 2, "Interaction history should contain both meetings.")
 
+    def test_meeting_invitation_includes_parsed_attendees(self):
+        """Additional attendee emails are parsed once, de-duplicated, and added to the calendar invite."""
+        from ui.tabs.meeting_tab import parse_attendee_emails, generate_calendar_invitation
+        attendees = "IT Director Mike Chen (mike@innovatetech.com), Security Lead Alex Rodriguez (alex@innovatetech.com), mike@innovatetech.com"
+        meeting_request = {
+            "lead_email": "david.kim@innovatetech.com",
+            "meeting_type": "Technical Discussion",
+            "attendees": attendees,
+            "attendee_emails": parse_attendee_emails(attendees)
+        }
+        invite = generate_calendar_invitation(meeting_request, {"suggested_time": "Monday 10:00 AM"})
+        expected_result = [
+            "david.kim@innovatetech.com",
+            "alex.thompson@yourcompany.com",
+            "alex@innovatetech.com",
+            "mike@innovatetech.com"
+        ]
+        self.assertEqual(invite["attendees"], expected_result)
+
+    def test_next_weekdays_skip_weekends_across_weeks(self):
+        """Next weekdays are consecutive Mon-Fri dates, spanning several weeks from a weekend start."""
+        from datetime import date
+        from ui.tabs.meeting_tab import get_next_weekdays
+        days = get_next_weekdays(7, start_date=date(2026, 10, 17))  # a Saturday
+        self.assertEqual(days[0], date(2026, 10, 19))
+        self.assertEqual(days[-1], date(2026, 10, 27))
+        self.assertTrue(all(d.weekday() < 5 for d in days))
+        self.assertEqual(len(set(days)), 7)
+
+    def test_merge_busy_intervals_collapses_overlaps(self):
+        """Overlapping or touching busy intervals merge into disjoint, ascending blocks."""
+        from datetime import datetime
+        from ui.tabs.meeting_tab import _merge_busy_intervals
+        at = lambda hour, minute=0: datetime(2026, 10, 20, hour, minute)
+        starts, ends = _merge_busy_intervals([
+            (at(9), at(12)),        # long block swallowing the next one
+            (at(10), at(10, 30)),
+            (at(12), at(13)),       # touches the first block
+            (at(15), at(16)),
+        ])
+        self.assertEqual(starts, [at(9), at(15)])
+        self.assertEqual(ends, [at(13), at(16)])
+
+    def test_slot_panels_share_one_busy_interval_query(self):
+        """The day picker and the suggested-times panel read the same cached free-slot entry."""
+        from ui.tabs import meeting_tab
+        calendar_manager = Mock()
+        calendar_manager.get_busy_intervals.return_value = []
+        meeting_tab._cached_free_slots_by_day.clear()
+        self.addCleanup(meeting_tab._cached_free_slots_by_day.clear)
+        window = meeting_tab.get_next_weekdays(meeting_tab._SLOT_WINDOW_DAYS)
+        meeting_tab.get_random_available_slots(calendar_manager, days=meeting_tab._SLOT_WINDOW_DAYS)
+        meeting_tab.get_available_slots_for_day(calendar_manager, window[0])
+        meeting_tab.get_random_available_slots(calendar_manager, days=meeting_tab._SLOT_WINDOW_DAYS)
+        calendar_manager.get_busy_intervals.assert_called_once()
+
+    def test_meeting_demo_does_not_leave_lead_in_mock_crm(self):
+        """The shared mock CRM only holds the UI lead while its scheduling context is built."""
+        import streamlit
+        from ui.tabs.meeting_tab import process_meeting_scheduling_demo
+        from workflows.run_schedule_meeting import build_context_from_meeting_request, mock_crm_data
+        streamlit.session_state.memory_manager = self.memory_manager
+        meeting_request = {
+            "lead_name": "Priya Shah",
+            "lead_email": "priya@northwind.io",
+            "lead_company": "Northwind",
+            "lead_role": "CTO",
+            "meeting_type": "Pricing Review",
+            "duration": "30 minutes",
+            "urgency": "High",
+            "attendees": "",
+            "context": ""
+        }
+        lead_id = self.memory_manager.get_or_create_lead_id("priya@northwind.io", {"name": "Priya Shah"})
+        contexts = []
+
+        def build_context(request_data, memory_manager):
+            context = build_context_from_meeting_request(request_data, memory_manager)
+            contexts.append(context)
+            return context
+
+        with patch('workflows.run_schedule_meeting.build_context_from_meeting_request', side_effect=build_context):
+            process_meeting_scheduling_demo(lead_id, meeting_request, self.memory_manager)
+        # The lead was visible while its context was built, and is gone afterwards
+        self.assertIn("Northwind", contexts[0]["lead_info"])
+        self.assertNotIn(lead_id, mock_crm_data)
+
 # --- Standalone pytest test for reply tab CRM before/after UI ---
 
 def test_reply_tab_crm_before_after(monkeypatch):
@@ -1145,12 +1262,100 @@ class TestDiscoverNewLeadsTab(unittest.TestCase):
             selected = self.dummy_leads[1]  # Bob
             draft = discover_tab.generate_outreach_email(selected["email"], "alice@acmecorp.com")
             edited = draft + "\nLet's connect soon."
-            discover_tab.submit_outreach_email(selected["email"], edited)
+            receipt = discover_tab.submit_outreach_email(selected["email"], edited)
+            self.assertTrue(receipt["success"])
+            # The send runs in the background; wait for it before checking the log
+            sent = discover_tab.st.session_state.discover_submit_future.result(timeout=5)
+            self.assertTrue(sent["success"])
             mock_log.assert_called_once()
             args, kwargs = mock_log.call_args
             self.assertIn(selected["email"], args)
             self.assertTrue(any("Let's connect soon." in str(arg) for arg in args))
 
+    def test_outreach_email_reuses_cached_template_for_same_company(self):
+        """Second draft for a company is synthesized from the cached template without calling the LLM."""
+        from ui.tabs import discover_tab
+        llm_draft = "Hi Bob Smith,\n\nAlice Johnson (alice@acmecorp.com) suggested I reach out to Acme Corp.\n\nBest,\nAlex"
+        with patch.dict(discover_tab._DRAFT_TEMPLATE_CACHE, clear=True), \
+             patch.dict(discover_tab._DRAFT_TEMPLATE_HITS, clear=True), \
+             patch('agents.agent_core.AgentCore') as mock_agent_core:
+            discover_tab._get_outreach_chain.clear()
+            self.addCleanup(discover_tab._get_outreach_chain.clear)
+            mock_chain = mock_agent_core.return_value.create_llm_chain.return_value
+            mock_chain.run.return_value = llm_draft
+            first = discover_tab.generate_outreach_email("bob@acmecorp.com", "alice@acmecorp.com")
+            second = discover_tab.generate_outreach_email("alice@acmecorp.com", "bob@acmecorp.com")
+            expected_result = "Hi Alice Johnson,\n\nBob Smith (bob@acmecorp.com) suggested I reach out to Acme Corp.\n\nBest,\nAlex"
+            self.assertEqual(first, llm_draft)
+            self.assertEqual(second, expected_result)
+            mock_chain.run.assert_called_once()
+
+    def test_outreach_email_template_does_not_replace_names_inside_words(self):
+        """A lead name that is part of another word in the draft never becomes a template slot."""
+        from ui.tabs import discover_tab
+        overlapping_leads = {
+            "al@acmecorp.com": {"name": "Al", "email": "al@acmecorp.com", "company": "Acme Corp"},
+            "tom@acmecorp.com": {"name": "Tom", "email": "tom@acmecorp.com", "company": "Acme Corp"},
+        }
+        llm_draft = "Hi Bob Smith,\n\nAl (al@acmecorp.com) suggested I reach out to Acme Corp.\n\nBest,\nAlex Thompson"
+        with patch.dict(discover_tab.LEADS_BY_EMAIL, overlapping_leads), \
+             patch.dict(discover_tab._DRAFT_TEMPLATE_CACHE, clear=True), \
+             patch.dict(discover_tab._DRAFT_TEMPLATE_HITS, clear=True), \
+             patch('agents.agent_core.AgentCore') as mock_agent_core:
+            discover_tab._get_outreach_chain.clear()
+            self.addCleanup(discover_tab._get_outreach_chain.clear)
+            mock_chain = mock_agent_core.return_value.create_llm_chain.return_value
+            mock_chain.run.return_value = llm_draft
+            discover_tab.generate_outreach_email("bob@acmecorp.com", "al@acmecorp.com")
+            # "Al" also appears inside "Alex", so the draft is not cached
+            self.assertNotIn("Acme Corp", discover_tab._DRAFT_TEMPLATE_CACHE)
+            mock_chain.run.return_value = llm_draft.replace("Al (al@", "Tom (tom@")
+            second = discover_tab.generate_outreach_email("bob@acmecorp.com", "tom@acmecorp.com")
+            self.assertNotIn("Tomex", second)
+            self.assertIn("Alex Thompson", second)
+            self.assertEqual(mock_chain.run.call_count, 2)
+        self.assertEqual(
+            discover_tab.build_draft_template("Hi Al, from Alex", {"known_name": "Tom"}),
+            "Hi Al, from Alex",
+        )
+
+    def test_outreach_email_template_slots_first_names(self):
+        """A draft that greets by first name is templated on the name parts, not left naming the first lead."""
+        from ui.tabs import discover_tab
+        llm_draft = "Hi Bob,\n\nAlice mentioned you. I work with Alice Johnson (alice@acmecorp.com) at Acme Corp.\n\nBest,\nAlex"
+        with patch.dict(discover_tab._DRAFT_TEMPLATE_CACHE, clear=True), \
+             patch.dict(discover_tab._DRAFT_TEMPLATE_HITS, clear=True), \
+             patch('agents.agent_core.AgentCore') as mock_agent_core:
+            discover_tab._get_outreach_chain.clear()
+            self.addCleanup(discover_tab._get_outreach_chain.clear)
+            mock_chain = mock_agent_core.return_value.create_llm_chain.return_value
+            mock_chain.run.return_value = llm_draft
+            discover_tab.generate_outreach_email("bob@acmecorp.com", "alice@acmecorp.com")
+            second = discover_tab.generate_outreach_email("alice@acmecorp.com", "bob@acmecorp.com")
+            self.assertEqual(
+                second,
+                "Hi Alice,\n\nBob mentioned you. I work with Bob Smith (bob@acmecorp.com) at Acme Corp.\n\nBest,\nAlex"
+            )
+            mock_chain.run.assert_called_once()
+        # A personal word the slots can't place (here in capitals) keeps the draft out of the cache
+        inputs = discover_tab.draft_template_inputs("Bob Smith", "Acme Corp", "Alice Johnson", "alice@acmecorp.com")
+        self.assertIsNone(discover_tab.build_draft_template("Hi Bob Smith, ALICE says hello.", inputs))
+
+    def test_outreach_email_spot_check_evicts_diverging_template(self):
+        """A spot check whose fresh draft differs from the synthesized one drops the cached template."""
+        from ui.tabs import discover_tab
+        with patch.dict(discover_tab._DRAFT_TEMPLATE_CACHE, {"Acme Corp": "Hi {target_name}, stale pitch."}, clear=True), \
+             patch.dict(discover_tab._DRAFT_TEMPLATE_HITS, {"Acme Corp": discover_tab.DRAFT_TEMPLATE_SPOT_CHECK_INTERVAL - 1}, clear=True), \
+             patch('agents.agent_core.AgentCore') as mock_agent_core:
+            discover_tab._get_outreach_chain.clear()
+            self.addCleanup(discover_tab._get_outreach_chain.clear)
+            mock_chain = mock_agent_core.return_value.create_llm_chain.return_value
+            mock_chain.run.return_value = "Hi Bob Smith, fresh pitch."
+            draft = discover_tab.generate_outreach_email("bob@acmecorp.com", "alice@acmecorp.com")
+            self.assertEqual(draft, "Hi Bob Smith, fresh pitch.")
+            mock_chain.run.assert_called_once()
+            self.assertNotIn("Acme Corp", discover_tab._DRAFT_TEMPLATE_CACHE)
+
     def test_discover_leads_edge_cases(self):
         """All error and edge cases are handled gracefully (e.g., empty input, selecting self, etc.)."""
         from ui.tabs import discover_tab
@@ -79,16 +79,33 @@ def display_agent_reasoning(reasoning_data: Dict[str, Any], title: str = "🧠 A
             st.write(f"**{k.replace('_', ' ').title()}:** {v}")
 
 
-def display_agent_timeline(steps: List[Dict[str, Any]], title: str = "📊 Agent Activity Timeline"):
+def display_agent_timeline(steps: List[Dict[str, Any]], title: str = "📊 Agent Activity Timeline", as_table: bool = False):
     """
     Display a timeline of agent actions and decisions.
     
     Args:
         steps: List of step dictionaries with action information
         title: Title for the timeline section
+        as_table: Render all steps as one table instead of a row of widgets each
     """
     st.subheader(title)
     
+    if as_table:
+        st.dataframe(
+            [
+                {
+                    "#": i,
+                    "Step": step.get("action", "Unknown action"),
+                    "Details": step.get("details", ""),
+                    "Time": _step_time_label(step)
+                }
+                for i, step in enumerate(steps, 1)
+            ],
+            hide_index=True,
+            use_container_width=True
+        )
+        return
+    
     for i, step in enumerate(steps, 1):
         with st.container():
             col1, col2, col3 = st.columns([1, 6, 2])
@@ -104,16 +121,24 @@ def display_agent_timeline(steps: List[Dict[str, Any]], title: str = "📊 Agent
                     st.caption(step["details"])
             
             with col3:
-                if "duration" in step:
-                    st.caption(f"⏱️ {step['duration']}")
-                elif "timestamp" in step:
-                    st.caption(f"🕐 {step['timestamp']}")
+                time_label = _step_time_label(step)
+                if time_label:
+                    st.caption(time_label)
         
         # Add separator except for last item
         if i < len(steps):
             st.markdown("↓")
 
 
+def _step_time_label(step: Dict[str, Any]) -> str:
+    """The step's duration, or failing that its timestamp, with an icon; empty if it has neither."""
+    if "duration" in step:
+        return f"⏱️ {step['duration']}"
+    if "timestamp" in step:
+        return f"🕐 {step['timestamp']}"
+    return ""
+
+
 def display_confidence_meter(confidence: float, label: str = "Agent Confidence"):
     """
     Display a confidence meter for agent decisions.
@@ -8,11 +8,24 @@ from typing import Dict, Any, List, Optional
 from datetime import datetime
 
 
+# Emoji shown for each interaction event type
+_EVENT_EMOJIS = {
+    'email_sent': '📧',
+    'email_received': '📨',
+    'call_made': '📞',
+    'meeting_scheduled': '📅',
+    'qualification_updated': '📊',
+    'reply_received': '💬',
+    'follow_up_scheduled': '⏰'
+}
+
+
 def display_crm_record(
     lead_data: Dict[str, Any], 
     qualification: Optional[Dict[str, Any]] = None,
     interactions: Optional[List[Dict[str, Any]]] = None,
-    title: str = "🗂 CRM Record"
+    title: str = "🗂 CRM Record",
+    interactions_as_table: bool = False
 ):
     """
     Display a complete CRM record for a lead.
@@ -22,6 +35,7 @@ def display_crm_record(
         qualification: Lead qualification data
         interactions: List of interactions with the lead
         title: Title for the CRM section
+        interactions_as_table: Show the interaction history as one table instead of per-row widgets
     """
     st.subheader(title)
     
@@ -76,7 +90,7 @@ def display_crm_record(
     # Interactions Section
     if interactions:
         st.markdown("### 📞 Interaction History")
-        display_interaction_timeline(interactions)
+        display_interaction_timeline(interactions, as_table=interactions_as_table)
 
 
 def display_before_after_crm(
@@ -134,43 +148,41 @@ def _display_crm_summary(data: Dict[str, Any], border_color: str = "lightgray"):
     st.markdown("</div>", unsafe_allow_html=True)
 
 
-def display_interaction_timeline(interactions: List[Dict[str, Any]]):
+def display_interaction_timeline(interactions: List[Dict[str, Any]], as_table: bool = False):
     """
     Display interaction history in a timeline format.
     
     Args:
         interactions: List of interaction records
+        as_table: Render all interactions as one table instead of a row of widgets each
     """
     if not interactions:
         st.info("No interactions recorded yet.")
         return
     
+    if as_table:
+        st.dataframe(
+            [
+                {
+                    "": _EVENT_EMOJIS.get(interaction.get('event_type', 'unknown'), '📝'),
+                    "Event": interaction.get('event_type', 'unknown').replace('_', ' ').title(),
+                    "Details": _interaction_caption(interaction.get('event_type', 'unknown'), interaction.get('event_data', {})) or "",
+                    "Time": _format_interaction_time(interaction.get('timestamp', 'Unknown time'))
+                }
+                for interaction in interactions
+            ],
+            hide_index=True,
+            use_container_width=True
+        )
+        return
+    
     for interaction in interactions:
         event_type = interaction.get('event_type', 'unknown')
-        timestamp = interaction.get('timestamp', 'Unknown time')
         event_data = interaction.get('event_data', {})
-        
-        # Format timestamp if it's a datetime string
-        try:
-            if isinstance(timestamp, str):
-                # Try to parse ISO format timestamp
-                dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                formatted_time = dt.strftime("%Y-%m-%d %H:%M:%S")
-            else:
-                formatted_time = str(timestamp)
-        except (ValueError, TypeError, AttributeError):
-            formatted_time = str(timestamp)
+        formatted_time = _format_interaction_time(interaction.get('timestamp', 'Unknown time'))
         
         # Choose emoji based on event type
-        event_emoji = {
-            'email_sent': '📧',
-            'email_received': '📨',
-            'call_made': '📞',
-            'meeting_scheduled': '📅',
-            'qualification_updated': '📊',
-            'reply_received': '💬',
-            'follow_up_scheduled': '⏰'
-        }.get(event_type, '📝')
+        event_emoji = _EVENT_EMOJIS.get(event_type, '📝')
         
         with st.container():
             col1, col2, col3 = st.columns([1, 6, 2])
@@ -182,14 +194,9 @@ def display_interaction_timeline(interactions: List[Dict[str, Any]]):
                 st.write(f"**{event_type.replace('_', ' ').title()}**")
                 
                 # Display relevant event data
-                if event_type == 'email_sent' and 'subject' in event_data:
-                    st.caption(f"Subject: {event_data['subject']}")
-                elif event_type == 'meeting_scheduled' and 'datetime' in event_data:
-                    st.caption(f"Scheduled for: {event_data['datetime']}")
-                elif event_type == 'qualification_updated' and 'lead_score' in event_data:
-                    st.caption(f"New score: {event_data['lead_score']}/100")
-                elif 'description' in event_data:
-                    st.caption(event_data['description'])
+                caption = _interaction_caption(event_type, event_data)
+                if caption:
+                    st.caption(caption)
             
             with col3:
                 st.caption(formatted_time)
@@ -197,6 +204,31 @@ def display_interaction_timeline(interactions: List[Dict[str, Any]]):
         st.markdown("---")
 
 
+def _format_interaction_time(timestamp: Any) -> str:
+    """Format an interaction timestamp, falling back to its string form."""
+    try:
+        if isinstance(timestamp, str):
+            # Try to parse ISO format timestamp
+            dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+            return dt.strftime("%Y-%m-%d %H:%M:%S")
+        return str(timestamp)
+    except (ValueError, TypeError, AttributeError):
+        return str(timestamp)
+
+
+def _interaction_caption(event_type: str, event_data: Dict[str, Any]) -> Optional[str]:
+    """The one-line detail shown under an interaction, if its event data has one."""
+    if event_type == 'email_sent' and 'subject' in event_data:
+        return f"Subject: {event_data['subject']}"
+    if event_type == 'meeting_scheduled' and 'datetime' in event_data:
+        return f"Scheduled for: {event_data['datetime']}"
+    if event_type == 'qualification_updated' and 'lead_score' in event_data:
+        return f"New score: {event_data['lead_score']}/100"
+    if 'description' in event_data:
+        return event_data['description']
+    return None
+
+
 def display_lead_metrics(qualification: Dict[str, Any]):
     """
     Display key lead metrics in a dashboard format.
@@ -5,10 +5,14 @@ Handles memory manager initialization and form data persistence.
 
 import streamlit as st
 import os
+from typing import Any, Optional, Tuple
 from memory.memory_manager import MemoryManager
 from memory.memory_store import SQLiteMemoryStore
 import time
 
+# Most demo results kept per tab in a session; older ones are evicted first
+MAX_DEMO_RESULTS_PER_TAB = 50
+
 
 def initialize_session_state():
     """Initialize session state variables for the app."""
@@ -21,8 +25,6 @@ def initialize_session_state():
         st.session_state.db_path = db_path
         memory_store = SQLiteMemoryStore(db_path)
         st.session_state.memory_manager = MemoryManager(memory_store)
-    else:
-        print(f"[DEBUG] Existing MemoryManager at {st.session_state.db_path}, id={id(st.session_state.memory_manager)}")
     
     # Initialize form data storage
     if 'form_data' not in st.session_state:
@@ -63,7 +65,22 @@ def store_demo_result(tab_name: str, lead_id: str, result: dict):
     """Store demo result for display."""
     if tab_name not in st.session_state.demo_results:
         st.session_state.demo_results[tab_name] = {}
-    st.session_state.demo_results[tab_name][lead_id] = result
+    results = st.session_state.demo_results[tab_name]
+    # Re-insert so the dict's insertion order tracks recency
+    results.pop(lead_id, None)
+    results[lead_id] = result
+    # Evict the oldest results so long-running sessions don't grow without bound
+    while len(results) > MAX_DEMO_RESULTS_PER_TAB:
+        del results[next(iter(results))]
+
+
+def get_latest_demo_result(tab_name: str) -> Optional[Tuple[str, Any]]:
+    """Return (lead_id, result) for the most recently stored demo result of a tab, if any."""
+    results = st.session_state.get('demo_results', {}).get(tab_name)
+    if not results:
+        return None
+    latest_lead_id = next(reversed(results))
+    return latest_lead_id, results[latest_lead_id]
 
 
 def get_demo_result(tab_name: str, lead_id: str) -> dict:
@@ -2,72 +2,237 @@
 Discover New Leads Tab - Backend Logic Stubs
 """
 
+import re
+import string
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+
 import streamlit as st
-from agents.agent_core import AgentCore
+from lib.bloom_filter import BloomFilter
 from lib.constants import default_model
 from lib.env_vars import OPENAI_API_KEY
 
-DUMMY_LEADS = []
+# Demo data (10 dummy leads, some overlap with other tabs)
+DUMMY_LEADS = [
+    {"name": "Alice Johnson", "email": "alice@acmecorp.com", "company": "Acme Corp"},
+    {"name": "Bob Smith", "email": "bob@acmecorp.com", "company": "Acme Corp"},
+    {"name": "Sarah Chen", "email": "sarah.chen@techcorp.com", "company": "TechCorp Industries"},
+    {"name": "David Kim", "email": "david.kim@innovatetech.com", "company": "InnovateTech Solutions"},
+    {"name": "Priya Patel", "email": "priya@finwise.com", "company": "Finwise"},
+    {"name": "John Lee", "email": "john.lee@medigen.com", "company": "Medigen"},
+    {"name": "Maria Garcia", "email": "maria@greengrid.com", "company": "GreenGrid"},
+    {"name": "Tom Brown", "email": "tom@buildwise.com", "company": "Buildwise"},
+    {"name": "Linda Xu", "email": "linda@cybercore.com", "company": "Cybercore"},
+    {"name": "Omar Farouk", "email": "omar@logix.com", "company": "Logix"},
+]
+
+def build_domain_index(leads: list) -> Dict[str, list]:
+    """Group leads by their casefolded email domain."""
+    index: Dict[str, list] = {}
+    for lead in leads:
+        index.setdefault(lead["email"].split('@', 1)[1].casefold(), []).append(lead)
+    return index
+
+def build_domain_bloom(domains) -> BloomFilter:
+    """Build a Bloom filter over the known lead domains."""
+    domains = list(domains)
+    bloom = BloomFilter(capacity=max(1, len(domains) * 2), error_rate=0.001)
+    for domain in domains:
+        bloom.add(domain)
+    return bloom
+
+_DEMO_OPTIONS = ("(None)", *(lead["email"] for lead in DUMMY_LEADS))
+LEADS_BY_EMAIL = {lead["email"].casefold(): lead for lead in DUMMY_LEADS}
+LEADS_BY_DOMAIN = build_domain_index(DUMMY_LEADS)
+# Screens out domains with no leads before the index lookup. Against this in-memory dict
+# it is slower than a plain LEADS_BY_DOMAIN.get (a few µs of hashing vs. a few hundred ns);
+# it only earns its place once the lead set outgrows memory and the index is a remote query.
+_DOMAIN_BLOOM = build_domain_bloom(LEADS_BY_DOMAIN)
 
+# Outreach drafts keyed by target company, stored as str.format templates so
+# structurally similar leads can skip the LLM call entirely.
+_DRAFT_TEMPLATE_CACHE: Dict[str, str] = {}
+_DRAFT_TEMPLATE_HITS: Dict[str, int] = {}
+# Every Nth cache hit for a company re-runs the LLM and checks the template still
+# renders the same draft; a template that diverges is evicted.
+DRAFT_TEMPLATE_SPOT_CHECK_INTERVAL = 10
+
+# LLM config for outreach drafts
+_LLM_CONFIG = {
+    "model": default_model,
+    "temperature": 0.3,
+    "max_tokens": 500,
+    "api_key": OPENAI_API_KEY,
+}
+_PROMPT_TEMPLATE = (
+    """
+    You are an expert sales development rep. Write a concise, friendly, and highly personalized cold outreach email to {{target_name}} at {{target_company}}. 
+    Reference that you are already in touch with their colleague {{known_name}} ({{known_email}}) to establish credibility. 
+    Clearly communicate the value of your service: saving hours of manual lead research and message crafting, and helping {{target_company}} discover new opportunities faster. 
+    Make the email actionable, easy to read, and end with a clear call to connect. 
+    Sign as Alex Thompson, Senior Solutions Consultant.
+    Only output the email body (no subject line).
+    """
+)
+_INPUT_VARIABLES = ["target_name", "target_company", "known_name", "known_email"]
+
+# Outreach sends run off the Streamlit script thread so the UI never blocks on I/O
+_SEND_EXECUTOR = ThreadPoolExecutor(max_workers=4)
+
+@st.cache_data(show_spinner=False)
 def find_leads_by_domain(email: str):
-    """Return a list of leads at the same domain as the given email, excluding the email itself."""
+    """Return a list of leads at the same domain as the given email, excluding the email itself.
+
+    Cached per email since DUMMY_LEADS is static; rebuild the lead indexes and
+    call find_leads_by_domain.clear() if the lead set ever changes.
+    """
     if not email or '@' not in email:
         return []
-    domain = email.split('@', 1)[1].lower()
-    return [lead for lead in DUMMY_LEADS if lead["email"].split('@', 1)[1].lower() == domain and lead["email"].lower() != email.lower()]
+    email_key = email.casefold()
+    domain = email_key.split('@', 1)[1]
+    if domain not in _DOMAIN_BLOOM:
+        return []
+    return [lead for lead in LEADS_BY_DOMAIN.get(domain, []) if lead["email"].casefold() != email_key]
+
+@st.cache_resource(show_spinner=False)
+def _get_outreach_chain():
+    """Build the outreach LLM chain once, importing the LLM stack on first use."""
+    from agents.agent_core import AgentCore
+    return AgentCore(_LLM_CONFIG).create_llm_chain(_PROMPT_TEMPLATE, _INPUT_VARIABLES)
+
+def draft_template_inputs(target_name: str, target_company: str, known_name: str, known_email: str) -> Dict[str, str]:
+    """The slot values for an outreach draft template: the LLM inputs plus the name parts and
+    email local part a draft may mention on their own (e.g. "Hi Bob," or "alice mentioned you")."""
+    inputs = {
+        "target_name": target_name,
+        "target_company": target_company,
+        "known_name": known_name,
+        "known_email": known_email,
+        "known_email_local": known_email.split("@")[0],
+    }
+    for role, name in (("target", target_name), ("known", known_name)):
+        parts = name.split()
+        # A one-word name is already covered by the full-name slot
+        inputs[f"{role}_first_name"] = parts[0] if len(parts) > 1 else ""
+        inputs[f"{role}_last_name"] = parts[-1] if len(parts) > 1 else ""
+    return inputs
+
+def build_draft_template(draft: str, variables: Dict[str, str]) -> Optional[str]:
+    """Turn a generated draft into a str.format template by replacing variable values with named slots.
+
+    Returns None when the draft can't be templated safely: two variables share a value, a
+    value also appears inside another word (e.g. a known name "Al" in the "Alex" signature),
+    or a word from a person's name or email is left as literal text.
+    """
+    escaped = draft.replace("{", "{{").replace("}", "}}")
+    values = {value: name for name, value in variables.items() if value}
+    if len(values) != sum(1 for value in variables.values() if value):
+        return None
+    if not values:
+        return escaped
+    # Longest values first so e.g. an email is replaced before the name inside it
+    pattern = re.compile(
+        "|".join(rf"\b{re.escape(value)}\b" for value in sorted(values, key=len, reverse=True))
+    )
+    template = pattern.sub(lambda match: "{" + values[match.group(0)] + "}", escaped)
+    # Any value left over sits inside another word and would be mangled on reuse
+    if any(value in template for value in values):
+        return None
+    # A leftover personal word (in any case) would name the wrong person once the template is reused
+    personal_words = {
+        word.casefold()
+        # The company is the cache key, and the email's words are its local part and domain
+        for name, value in variables.items() if name not in ("target_company", "known_email")
+        for word in re.findall(r"[^\W_]+", value)
+    }
+    literal_text = re.sub(r"\{\w+\}", " ", template)
+    if any(word.casefold() in personal_words for word in re.findall(r"[^\W_]+", literal_text)):
+        return None
+    return template
+
+def _template_fillable(template: str, inputs: Dict[str, str]) -> bool:
+    """Whether every slot the template uses has a value for this lead."""
+    return all(inputs.get(field) for _, field, _, _ in string.Formatter().parse(template) if field)
 
 def generate_outreach_email(target_email: str, known_email: str) -> str:
-    """Generate a draft outreach email to target_email referencing known_email using LLM."""
+    """Generate a draft outreach email to target_email referencing known_email using LLM.
+
+    Drafts for a company are generated once by the LLM and then synthesized from
+    the cached template, with a periodic LLM spot check that evicts the template
+    if its rendering no longer matches a fresh draft.
+    """
     # Find target lead info
-    target_lead = next((lead for lead in DUMMY_LEADS if lead["email"].lower() == target_email.lower()), None)
-    known_lead = next((lead for lead in DUMMY_LEADS if lead["email"].lower() == known_email.lower()), None)
+    target_lead = LEADS_BY_EMAIL.get(target_email.casefold())
+    known_lead = LEADS_BY_EMAIL.get(known_email.casefold())
     target_name = target_lead["name"] if target_lead else "there"
     target_company = target_lead["company"] if target_lead else "your company"
     known_name = known_lead["name"] if known_lead else known_email.split("@")[0].title()
+    template_inputs = draft_template_inputs(target_name, target_company, known_name, known_email)
+
+    # Fast path: synthesize from the cached template for this company
+    cached_template = _DRAFT_TEMPLATE_CACHE.get(target_company)
+    spot_check_draft = None
+    if cached_template is not None and _template_fillable(cached_template, template_inputs):
+        hits = _DRAFT_TEMPLATE_HITS.get(target_company, 0) + 1
+        _DRAFT_TEMPLATE_HITS[target_company] = hits
+        synthesized = cached_template.format(**template_inputs)
+        if hits % DRAFT_TEMPLATE_SPOT_CHECK_INTERVAL != 0:
+            return synthesized
+        spot_check_draft = synthesized
 
-    # LLM config
-    llm_config = {
-        "model": default_model,
-        "temperature": 0.3,
-        "max_tokens": 500,
-        "api_key": OPENAI_API_KEY,
-    }
-    agent_core = AgentCore(llm_config)
-    prompt_template = (
-        """
-        You are an expert sales development rep. Write a concise, friendly, and highly personalized cold outreach email to {{target_name}} at {{target_company}}. 
-        Reference that you are already in touch with their colleague {{known_name}} ({{known_email}}) to establish credibility. 
-        Clearly communicate the value of your service: saving hours of manual lead research and message crafting, and helping {{target_company}} discover new opportunities faster. 
-        Make the email actionable, easy to read, and end with a clear call to connect. 
-        Sign as Alex Thompson, Senior Solutions Consultant.
-        Only output the email body (no subject line).
-        """
-    )
-    input_variables = ["target_name", "target_company", "known_name", "known_email"]
     try:
-        chain = agent_core.create_llm_chain(prompt_template, input_variables)
+        chain = _get_outreach_chain()
         email_body = chain.run(
             target_name=target_name,
             target_company=target_company,
             known_name=known_name,
             known_email=known_email,
         )
-        return email_body.strip()
+        email_body = email_body.strip()
+        if spot_check_draft is not None:
+            # The slot values are already filled in, so any difference is in the template itself
+            if email_body != spot_check_draft:
+                _DRAFT_TEMPLATE_CACHE.pop(target_company, None)
+                _DRAFT_TEMPLATE_HITS.pop(target_company, None)
+            return email_body
+        # Only cache drafts that are actually personalized to a known target; unknown
+        # leads all share the "there"/"your company" placeholders
+        if target_lead and any(
+            template_inputs[field] and template_inputs[field] in email_body
+            for field in ("target_name", "target_first_name")
+        ):
+            template = build_draft_template(email_body, template_inputs)
+            if template is not None:
+                _DRAFT_TEMPLATE_CACHE[target_company] = template
+        return email_body
     except Exception as e:
         # Fallback to mock
         print(f"Error generating outreach email: {e}\nFallback to mock")
         return f"Hi {target_name},\n\nI'm reaching out because I'm already working with {known_name} at {target_company}. I thought you might also benefit from what we're doing—helping teams like yours save hours on lead research and outreach. Would you be open to a quick call to explore?\n\nBest,\nAlex Thompson\nSenior Solutions Consultant"
 
-def submit_outreach_email(target_email: str, email_body: str) -> dict:
-    """Simulate submitting the outreach email. Returns a dict with success and message."""
-    log_outreach_action(target_email, email_body)
+def send_outreach_email(target_email: str, email_body: str) -> dict:
+    """Simulate sending the outreach email. Runs on the background send executor."""
+    try:
+        log_outreach_action(target_email, email_body)
+    except Exception as e:
+        return {"success": False, "message": f"Failed to send outreach email to {target_email}: {e}"}
     return {"success": True, "message": f"Outreach email sent to {target_email}."}
 
+def submit_outreach_email(target_email: str, email_body: str) -> dict:
+    """Queue the outreach email for sending. Returns a receipt immediately.
+
+    The pending send is stored in st.session_state.discover_submit_future and
+    resolves to the same success/message dict once the send completes.
+    """
+    st.session_state.discover_submit_future = _SEND_EXECUTOR.submit(send_outreach_email, target_email, email_body)
+    return {"success": True, "message": f"Outreach email to {target_email} queued for sending."}
+
+@st.cache_data(show_spinner=False)
 def no_leads_found_message(email: str) -> str:
     """Return a user-friendly message if no leads are found for the domain."""
     if not email or '@' not in email:
         return "Sorry, we didn't discover any new leads related to {}.".format(email)
-    domain = email.split('@', 1)[1].lower()
+    domain = email.split('@', 1)[1].casefold()
     return f"Sorry, we didn't discover any new leads related to {email} (domain: {domain})."
 
 def handle_input_change(manual_input: str, demo_selected: str):
@@ -100,22 +265,6 @@ def render_discover_tab():
     - **Event attendee lists**: Use lists from conferences, webinars, or trade shows.
     """)
 
-    # --- Demo data (10 dummy leads, some overlap with other tabs) ---
-    global DUMMY_LEADS
-    if not DUMMY_LEADS:
-        DUMMY_LEADS = [
-            {"name": "Alice Johnson", "email": "alice@acmecorp.com", "company": "Acme Corp"},
-            {"name": "Bob Smith", "email": "bob@acmecorp.com", "company": "Acme Corp"},
-            {"name": "Sarah Chen", "email": "sarah.chen@techcorp.com", "company": "TechCorp Industries"},
-            {"name": "David Kim", "email": "david.kim@innovatetech.com", "company": "InnovateTech Solutions"},
-            {"name": "Priya Patel", "email": "priya@finwise.com", "company": "Finwise"},
-            {"name": "John Lee", "email": "john.lee@medigen.com", "company": "Medigen"},
-            {"name": "Maria Garcia", "email": "maria@greengrid.com", "company": "GreenGrid"},
-            {"name": "Tom Brown", "email": "tom@buildwise.com", "company": "Buildwise"},
-            {"name": "Linda Xu", "email": "linda@cybercore.com", "company": "Cybercore"},
-            {"name": "Omar Farouk", "email": "omar@logix.com", "company": "Logix"},
-        ]
-
     # --- State management ---
     if 'discover_manual_email' not in st.session_state:
         st.session_state.discover_manual_email = ""
@@ -125,8 +274,12 @@ def render_discover_tab():
         st.session_state.discover_selected_lead = None
     if 'discover_outreach_draft' not in st.session_state:
         st.session_state.discover_outreach_draft = ""
+    if 'discover_draft_key' not in st.session_state:
+        st.session_state.discover_draft_key = None
     if 'discover_submit_result' not in st.session_state:
         st.session_state.discover_submit_result = None
+    if 'discover_submit_future' not in st.session_state:
+        st.session_state.discover_submit_future = None
 
     # --- Email input section ---
     st.subheader("Step 1: Enter or Select a Known Lead's Email")
@@ -134,8 +287,7 @@ def render_discover_tab():
     with col1:
         manual_email = st.text_input("Enter email of a known contact", value=st.session_state.discover_manual_email, key="discover_manual_email_input")
     with col2:
-        demo_options = [lead["email"] for lead in DUMMY_LEADS]
-        demo_email = st.selectbox("Or pick a demo email", ["(None)"] + demo_options, index=0, key="discover_demo_email_select")
+        demo_email = st.selectbox("Or pick a demo email", _DEMO_OPTIONS, index=0, key="discover_demo_email_select")
         if demo_email == "(None)":
             demo_email = ""
 
@@ -167,19 +319,29 @@ def render_discover_tab():
         st.info("""
         **Save hours of manual research and message crafting** — let AI generate a personalized, high-converting outreach email in seconds.\n\nThis email references your existing contact to boost credibility and is tailored to maximize response rates.
         """, icon="💡")
-        # Try to generate outreach email, fallback to mock
-        try:
-            draft = generate_outreach_email(selected_lead["email"], input_email)
-        except Exception:
-            draft = f"Hi {selected_lead['name']},\n\nWe're working with {input_email} and thought you might be interested in what we're doing at {selected_lead['company']}. Would love to connect!\n\nBest,\nYour Name"
-        st.session_state.discover_outreach_draft = st.text_area("Outreach Email Draft", value=draft, height=180, key="discover_outreach_draft_area")
+        # Only generate a new draft when the lead pair changes so user edits survive reruns
+        draft_key = (selected_lead["email"], input_email)
+        if st.session_state.discover_draft_key != draft_key:
+            st.session_state.discover_outreach_draft_area = generate_outreach_email(selected_lead["email"], input_email)
+            st.session_state.discover_draft_key = draft_key
+        st.session_state.discover_outreach_draft = st.text_area("Outreach Email Draft", height=180, key="discover_outreach_draft_area")
         if st.button("Send Outreach Email", key="discover_send_btn"):
             result = submit_outreach_email(selected_lead["email"], st.session_state.discover_outreach_draft)
             st.session_state.discover_submit_result = result
-            st.success(result["message"])
     elif input_email and discovered_leads:
         st.info("Select a lead above to generate an outreach email.")
 
     # --- Step 4: Submission result ---
-    if st.session_state.discover_submit_result:
-        st.success(st.session_state.discover_submit_result["message"]) 
\ No newline at end of file
+    submit_future = st.session_state.discover_submit_future
+    if submit_future is not None and submit_future.done():
+        st.session_state.discover_submit_result = submit_future.result()
+        st.session_state.discover_submit_future = None
+    submit_result = st.session_state.discover_submit_result
+    if submit_result:
+        if submit_result["success"]:
+            st.success(submit_result["message"])
+        else:
+            st.error(submit_result["message"])
+        if st.button("Dismiss", key="discover_dismiss_result_btn"):
+            st.session_state.discover_submit_result = None
+            st.rerun() 
\ No newline at end of file
@@ -1,81 +1,86 @@
 import streamlit as st
 
-def render_next_steps_tab():
-    st.title("🚀 Next Steps for Productionization")
-    st.markdown("""
-    This section outlines the key next steps to take the Leads AI Agent Demo from prototype to production. Each step is prioritized for business impact and value to non-technical stakeholders.
-    """)
-
-    st.header("1. Memory & Context")
-    st.subheader("A. Persistent Lead Memory")
-    st.markdown("""
-    - **Action:** Save and retrieve the full history of interactions with each lead.
-    - **How:** Implement a database or vector store for storing conversations, metadata, and summaries (short-term & long-term memory).
-    - **Value:** Enables personalized, context-aware follow-ups and smarter automation.
-    """)
-
-    st.header("2. Lead Scoring & Qualification")
-    st.subheader("A. Automated Lead Scoring")
-    st.markdown("""
-    - **Action:** Score and prioritize leads based on likelihood to convert.
-    - **How:** Use AI models and business rules to analyze lead data and engagement.
-    - **Value:** Focuses sales effort on high-potential leads, improving conversion rates.
-    """)
-
-    st.header("3. Deployment & Triggering")
-    st.subheader("A. Production-Ready Agent Deployment")
-    st.markdown("""
-    - **Action:** Deploy the agent as a scalable service (API, container, or serverless function).
-    - **How:** Use FastAPI, AWS Lambda, or Docker; trigger via webhooks, scheduled jobs, or form submissions.
-    - **Value:** Ensures reliable, real-time or scheduled automation integrated with business workflows.
-    """)
+# (section, subsection, action, how, value) for each productionization step
+_NEXT_STEPS = (
+    (
+        "1. Memory & Context",
+        "A. Persistent Lead Memory",
+        "Save and retrieve the full history of interactions with each lead.",
+        "Implement a database or vector store for storing conversations, metadata, and summaries (short-term & long-term memory).",
+        "Enables personalized, context-aware follow-ups and smarter automation.",
+    ),
+    (
+        "2. Lead Scoring & Qualification",
+        "A. Automated Lead Scoring",
+        "Score and prioritize leads based on likelihood to convert.",
+        "Use AI models and business rules to analyze lead data and engagement.",
+        "Focuses sales effort on high-potential leads, improving conversion rates.",
+    ),
+    (
+        "3. Deployment & Triggering",
+        "A. Production-Ready Agent Deployment",
+        "Deploy the agent as a scalable service (API, container, or serverless function).",
+        "Use FastAPI, AWS Lambda, or Docker; trigger via webhooks, scheduled jobs, or form submissions.",
+        "Ensures reliable, real-time or scheduled automation integrated with business workflows.",
+    ),
+    (
+        "4. Integration with Business Tools",
+        "A. CRM, Email, and Calendar Integration",
+        "Connect agent to Zoho CRM, Gmail, Google Calendar, and other tools.",
+        "Register webhooks, use official APIs, and handle authentication securely.",
+        "Automates end-to-end workflows and keeps all systems in sync.",
+    ),
+    (
+        "5. Observability & Auditability",
+        "A. Action Logging and Monitoring",
+        "Log all agent actions, inputs, outputs, and errors.",
+        "Store logs in a database or export to dashboards (Google Sheets, Datadog, etc.).",
+        "Builds trust, enables debugging, and supports compliance.",
+    ),
+    (
+        "6. Cost Management",
+        "A. Track and Optimize LLM/API Costs",
+        "Monitor API usage and cost per automated task.",
+        "Instrument agent runs to log token usage and API spend; compare to manual costs.",
+        "Ensures scalability and cost-effectiveness for the business.",
+    ),
+    (
+        "7. Security & Compliance",
+        "A. Data Privacy and Protection",
+        "Encrypt sensitive data and redact PII in logs and LLM prompts.",
+        "Use encryption libraries and automated redaction before storage/logging.",
+        "Protects business and customer data, supporting compliance needs.",
+    ),
+    (
+        "8. Agility & Workflow Expansion",
+        "A. Rapid Addition of New Automations",
+        "Build modular templates for new workflows and integrations.",
+        "Use reusable code patterns and CI/CD for fast deployment.",
+        "Enables quick response to changing business needs and opportunities.",
+    ),
+    (
+        "9. User Feedback & Continuous Improvement",
+        "A. Stakeholder Feedback Loops",
+        "Collect feedback from users on agent actions and outcomes.",
+        "Use surveys, in-app feedback, or review dashboards.",
+        "Ensures the agent delivers real value and evolves with user needs.",
+    )
+)
 
-    st.header("4. Integration with Business Tools")
-    st.subheader("A. CRM, Email, and Calendar Integration")
-    st.markdown("""
-    - **Action:** Connect agent to Zoho CRM, Gmail, Google Calendar, and other tools.
-    - **How:** Register webhooks, use official APIs, and handle authentication securely.
-    - **Value:** Automates end-to-end workflows and keeps all systems in sync.
-    """)
+# The tab is entirely static, so its markdown is assembled once at import and emitted as a
+# single element instead of a header, subheader and bullet block per step
+_NEXT_STEPS_MD = "\n\n".join([
+    "This section outlines the key next steps to take the Leads AI Agent Demo from prototype to production. Each step is prioritized for business impact and value to non-technical stakeholders.",
+    *(
+        f"## {section}\n\n### {subsection}\n\n"
+        f"- **Action:** {action}\n- **How:** {how}\n- **Value:** {value}"
+        for section, subsection, action, how, value in _NEXT_STEPS
+    ),
+])
 
-    st.header("5. Observability & Auditability")
-    st.subheader("A. Action Logging and Monitoring")
-    st.markdown("""
-    - **Action:** Log all agent actions, inputs, outputs, and errors.
-    - **How:** Store logs in a database or export to dashboards (Google Sheets, Datadog, etc.).
-    - **Value:** Builds trust, enables debugging, and supports compliance.
-    """)
 
-    st.header("6. Cost Management")
-    st.subheader("A. Track and Optimize LLM/API Costs")
-    st.markdown("""
-    - **Action:** Monitor API usage and cost per automated task.
-    - **How:** Instrument agent runs to log token usage and API spend; compare to manual costs.
-    - **Value:** Ensures scalability and cost-effectiveness for the business.
-    """)
-
-    st.header("7. Security & Compliance")
-    st.subheader("A. Data Privacy and Protection")
-    st.markdown("""
-    - **Action:** Encrypt sensitive data and redact PII in logs and LLM prompts.
-    - **How:** Use encryption libraries and automated redaction before storage/logging.
-    - **Value:** Protects business and customer data, supporting compliance needs.
-    """)
-
-    st.header("8. Agility & Workflow Expansion")
-    st.subheader("A. Rapid Addition of New Automations")
-    st.markdown("""
-    - **Action:** Build modular templates for new workflows and integrations.
-    - **How:** Use reusable code patterns and CI/CD for fast deployment.
-    - **Value:** Enables quick response to changing business needs and opportunities.
-    """)
-
-    st.header("9. User Feedback & Continuous Improvement")
-    st.subheader("A. Stakeholder Feedback Loops")
-    st.markdown("""
-    - **Action:** Collect feedback from users on agent actions and outcomes.
-    - **How:** Use surveys, in-app feedback, or review dashboards.
-    - **Value:** Ensures the agent delivers real value and evolves with user needs.
-    """)
+def render_next_steps_tab():
+    st.title("🚀 Next Steps for Productionization")
+    st.markdown(_NEXT_STEPS_MD)
 
-    st.info("These next steps are designed to unlock business value, ensure reliability, and prepare the AI agent for real-world deployment.") 
\ No newline at end of file
+    st.info("These next steps are designed to unlock business value, ensure reliability, and prepare the AI agent for real-world deployment.")
@@ -3,11 +3,12 @@ Contact form qualification tab.
 Demonstrates the lead qualification workflow from contact form submission to follow-up email.
 """
 
+import functools
 import streamlit as st
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 from unittest.mock import patch
 
-from ui.state.session import get_memory_manager, get_next_lead_id, store_demo_result
+from ui.state.session import get_latest_demo_result, get_memory_manager, get_next_lead_id, store_demo_result
 from ui.components.agent_visualizer import display_agent_reasoning, display_agent_timeline
 from ui.components.crm_viewer import display_crm_record
 from ui.components.email_display import display_email_output
@@ -17,6 +18,110 @@ from integrations.slack_manager import SlackManager
 from integrations.zoho_manager import ZohoManager
 
 
+# Follow-up email (subject, body) templates by lead-score tier, filled with str.format_map
+_FOLLOW_UP_HIGH_TEMPLATE = (
+    "Perfect timing for {company}'s automation goals",
+    """Hi {name},
+
+Thank you for reaching out about automation solutions for {company}. Based on your message, it sounds like you're facing exactly the challenges our platform was designed to solve.
+
+As {role}, you're likely seeing firsthand how manual processes can slow down your team's productivity. Our automation platform has helped similar companies reduce manual work by 60% while improving lead conversion rates.
+
+I'd love to show you a personalized demo of how this could work specifically for {company}. Would you be available for a brief 30-minute call this week?
+
+I can also send over a case study from a similar company that saw immediate results.
+
+Best regards,
+Alex Thompson
+Senior Solutions Consultant
+sales@yourcompany.com
+(555) 123-4567"""
+)
+
+_FOLLOW_UP_MEDIUM_TEMPLATE = (
+    "Solutions for {company}'s automation needs",
+    """Hi {name},
+
+Thanks for your interest in our automation solutions. I appreciate you taking the time to reach out.
+
+Based on your message, it sounds like {company} could benefit from streamlining your current processes. Our platform helps companies like yours automate repetitive tasks and improve efficiency.
+
+I'd be happy to schedule a brief call to learn more about your specific needs and show you how our solution might help.
+
+Would you prefer a quick 15-minute call or would you like me to send some information first?
+
+Best regards,
+Alex Thompson
+Solutions Consultant
+sales@yourcompany.com"""
+)
+
+# Lower-value lead - nurture approach
+_FOLLOW_UP_NURTURE_TEMPLATE = (
+    "Resources for your automation journey",
+    """Hi {name},
+
+Thank you for your interest in automation solutions. It's great to see {company} exploring ways to improve efficiency.
+
+I've attached a helpful guide on "Getting Started with Sales Automation" that many companies find valuable when beginning their automation journey.
+
+If you'd like to discuss your specific needs, I'm here to help. Feel free to reply to this email or schedule a call at your convenience.
+
+Best regards,
+Alex Thompson
+Solutions Consultant
+sales@yourcompany.com"""
+)
+
+# "Quick Fill" contact forms. Session state holds a reference to these, so they are only ever read
+_ENTERPRISE_SAMPLE = {
+    "name": "Sarah Chen",
+    "email": "sarah.chen@techcorp.com",
+    "company": "TechCorp Industries",
+    "role": "Chief Technology Officer",
+    "message": "We're looking for automation solutions to streamline our sales process. We have a team of 200+ sales reps and need better lead management. Budget approved for Q1 implementation."
+}
+
+_SMB_SAMPLE = {
+    "name": "Mike Rodriguez",
+    "email": "mike@localservices.com",
+    "company": "Local Services LLC",
+    "role": "Owner",
+    "message": "Small business owner here. Heard about your tools from a friend. Not sure if it's right for us but interested to learn more."
+}
+
+# HTML blocks for display_qualification_results, filled with str.format
+_HEADER_TEMPLATE = """
+    <div style="background: #f8f9fa; border-radius: 12px; padding: 24px; margin-bottom: 16px; box-shadow: 0 2px 8px #e9ecef;">
+      <div style="display: flex; align-items: center;">
+        <div style="font-size: 2.2em; font-weight: bold; margin-right: 16px;">{name}</div>
+        <div style="font-size: 1.2em; color: #6c757d;">{company}</div>
+        <span style="margin-left: auto; background: #e0f7fa; color: #00796b; border-radius: 8px; padding: 4px 12px; font-size: 0.9em;">Qualified by AI</span>
+      </div>
+    </div>
+    """
+
+_ACTION_ROW_TEMPLATE = """
+    <div style="margin: 16px 0; padding: 12px; background: #e3f2fd; border-radius: 8px;">
+      <b>Next Action:</b> <span style="font-size:1.1em;">{next_action}</span>
+      <span style="margin-left: 16px; background: #fff3e0; color: #ef6c00; border-radius: 6px; padding: 2px 10px;">Urgency: {urgency}</span>
+    </div>
+    """
+
+_SIGNAL_CHIP_TEMPLATE = "<span style='display:inline-block;background:#e0f2f1;color:#00695c;border-radius:16px;padding:4px 14px;margin:2px 6px 2px 0;font-size:0.98em;font-weight:500;box-shadow:0 1px 3px #e0e0e0;'>{signal}</span>"
+
+_VALID_URGENCIES = frozenset({"Low", "Medium", "High", "Urgent"})
+
+# Interaction fields carried onto a timeline step when present
+_TIMELINE_STEP_FIELDS = ("lead_score", "priority")
+
+# Minimum lead score for each follow-up tier, highest first
+_FOLLOW_UP_TIERS = (
+    (80, _FOLLOW_UP_HIGH_TEMPLATE),
+    (60, _FOLLOW_UP_MEDIUM_TEMPLATE),
+)
+
+
 def render_qualify_tab():
     """Render the contact form qualification tab."""    
     st.markdown("""
@@ -42,24 +147,12 @@ def render_qualify_tab():
         
         with col_a:
             if st.button("🏢 Enterprise Lead", key="qualify_enterprise_btn"):
-                st.session_state.qualify_sample_data = {
-                    "name": "Sarah Chen",
-                    "email": "sarah.chen@techcorp.com",
-                    "company": "TechCorp Industries",
-                    "role": "Chief Technology Officer",
-                    "message": "We're looking for automation solutions to streamline our sales process. We have a team of 200+ sales reps and need better lead management. Budget approved for Q1 implementation."
-                }
+                st.session_state.qualify_sample_data = _ENTERPRISE_SAMPLE
                 st.rerun()
         
         with col_b:
             if st.button("🏪 SMB Lead", key="qualify_smb_btn"):
-                st.session_state.qualify_sample_data = {
-                    "name": "Mike Rodriguez",
-                    "email": "mike@localservices.com",
-                    "company": "Local Services LLC",
-                    "role": "Owner",
-                    "message": "Small business owner here. Heard about your tools from a friend. Not sure if it's right for us but interested to learn more."
-                }
+                st.session_state.qualify_sample_data = _SMB_SAMPLE
                 st.rerun()
         
         # Get current values (either from sample data or empty)
@@ -123,48 +216,60 @@ def render_qualify_tab():
             "role": role or "Unknown Role",
             "message": message
         }
-        # Add Zoho source field
-        zoho_lead_data = form_data.copy()
-        zoho_lead_data["source"] = "Qualification Inbound"
-        # Generate unique lead ID
-        lead_id = get_next_lead_id()
-        # Process the qualification
-        with st.spinner("🤖 AI Agent is processing the lead..."):
-            result = process_qualification_demo(lead_id, form_data)
-        # Store both result and form_data for display and testability
-        store_demo_result("qualify", lead_id, {"result": result, "form_data": form_data})
-        # --- EMAIL SENDING LOGIC ---
-        send_qualification_email(form_data, result)
-        # --- ZOHO LEAD CREATION LOGIC ---
-        try:
-            zoho_manager = ZohoManager()
-            zoho_manager.create_lead(zoho_lead_data)
-            st.success("Lead created in Zoho CRM!")
-        except Exception as e:
-            st.error(f"Failed to create lead in Zoho CRM: {e}")
-        # --- SLACK NOTIFICATION LOGIC ---
-        try:
-            slack = SlackManager()
-            followup = generate_follow_up_email(form_data, result)
-            slack.send_message(
-                channel_name="qualified-leads",
-                title=followup['subject'],
-                body=followup['body']
-            )
-        except Exception as e:
-            print(f"Error sending Slack notification: {e}")
+        # A repeated submit of identical form content (double click, resubmitting after a
+        # rerun) reuses the stored result instead of re-running the LLM workflow and
+        # notifying Zoho, Slack and email a second time
+        submit_key = tuple(sorted(form_data.items()))
+        last_key, last_lead_id = st.session_state.get('qualify_last_submit', (None, None))
+        stored_results = st.session_state.get('demo_results', {}).get('qualify', {})
+        if submit_key == last_key and last_lead_id in stored_results:
+            lead_id = last_lead_id
+            result = stored_results[lead_id]["result"]
+            st.info("This contact form was already processed; showing the existing result.")
+        else:
+            # Add Zoho source field
+            zoho_lead_data = form_data.copy()
+            zoho_lead_data["source"] = "Qualification Inbound"
+            # Generate unique lead ID
+            lead_id = get_next_lead_id()
+            # Process the qualification
+            with st.spinner("🤖 AI Agent is processing the lead..."):
+                result = process_qualification_demo(lead_id, form_data)
+            # Store both result and form_data for display and testability
+            store_demo_result("qualify", lead_id, {"result": result, "form_data": form_data})
+            # --- EMAIL SENDING LOGIC ---
+            send_qualification_email(form_data, result)
+            # --- ZOHO LEAD CREATION LOGIC ---
+            try:
+                zoho_manager = ZohoManager()
+                zoho_manager.create_lead(zoho_lead_data)
+                st.success("Lead created in Zoho CRM!")
+            except Exception as e:
+                st.error(f"Failed to create lead in Zoho CRM: {e}")
+            # --- SLACK NOTIFICATION LOGIC ---
+            try:
+                slack = SlackManager()
+                followup = generate_follow_up_email(form_data, result)
+                slack.send_message(
+                    channel_name="qualified-leads",
+                    title=followup['subject'],
+                    body=followup['body']
+                )
+            except Exception as e:
+                print(f"Error sending Slack notification: {e}")
+            st.session_state.qualify_last_submit = (submit_key, lead_id)
+
         # Display results
         display_qualification_results(lead_id, form_data, result)
     
     # Show previous results if any
-    elif hasattr(st.session_state, 'demo_results') and 'qualify' in st.session_state.demo_results:
+    elif 'qualify' in st.session_state.get('demo_results', {}):
         st.markdown("---")
         st.subheader("📋 Previous Demo Results")
         
-        results = st.session_state.demo_results['qualify']
-        if results:
-            latest_lead_id = max(results.keys())
-            latest_result = results[latest_lead_id]
+        latest = get_latest_demo_result('qualify')
+        if latest:
+            latest_lead_id, latest_result = latest
             # If stored as {"result": ..., "form_data": ...}
             if isinstance(latest_result, dict) and "result" in latest_result and "form_data" in latest_result:
                 display_qualification_results(latest_lead_id, latest_result["form_data"], latest_result["result"])
@@ -196,6 +301,21 @@ def process_qualification_demo(lead_id: str, form_data: Dict[str, Any]) -> LeadQ
     return qualification
 
 
+def _follow_up_tier(lead_score) -> Tuple[str, str]:
+    """The (subject, body) template pair for a lead score."""
+    for min_score, template in _FOLLOW_UP_TIERS:
+        if lead_score >= min_score:
+            return template
+    return _FOLLOW_UP_NURTURE_TEMPLATE
+
+
+@functools.lru_cache(maxsize=128)
+def _render_follow_up_email(template: Tuple[str, str], name: str, company: str, role: str) -> Tuple[str, str]:
+    """Fill a follow-up template; memoized since each submit renders it for both the email and Slack."""
+    values = {'name': name, 'company': company, 'role': role}
+    return template[0].format_map(values), template[1].format_map(values)
+
+
 def generate_follow_up_email(form_data: Dict[str, Any], qualification) -> Dict[str, Any]:
     """Generate a follow-up email based on qualification results."""
     name = form_data.get('name', 'there')
@@ -211,56 +331,7 @@ def generate_follow_up_email(form_data: Dict[str, Any], qualification) -> Dict[s
     lead_score = get_field(qualification, 'lead_score', 50)
     priority = get_field(qualification, 'priority', 'medium')
 
-    if lead_score >= 80:
-        # High-value lead
-        subject = f"Perfect timing for {company}'s automation goals"
-        body = f"""Hi {name},
-
-Thank you for reaching out about automation solutions for {company}. Based on your message, it sounds like you're facing exactly the challenges our platform was designed to solve.
-
-As {role}, you're likely seeing firsthand how manual processes can slow down your team's productivity. Our automation platform has helped similar companies reduce manual work by 60% while improving lead conversion rates.
-
-I'd love to show you a personalized demo of how this could work specifically for {company}. Would you be available for a brief 30-minute call this week?
-
-I can also send over a case study from a similar company that saw immediate results.
-
-Best regards,
-Alex Thompson
-Senior Solutions Consultant
-sales@yourcompany.com
-(555) 123-4567"""
-    elif lead_score >= 60:
-        # Medium-value lead
-        subject = f"Solutions for {company}'s automation needs"
-        body = f"""Hi {name},
-
-Thanks for your interest in our automation solutions. I appreciate you taking the time to reach out.
-
-Based on your message, it sounds like {company} could benefit from streamlining your current processes. Our platform helps companies like yours automate repetitive tasks and improve efficiency.
-
-I'd be happy to schedule a brief call to learn more about your specific needs and show you how our solution might help.
-
-Would you prefer a quick 15-minute call or would you like me to send some information first?
-
-Best regards,
-Alex Thompson
-Solutions Consultant
-sales@yourcompany.com"""
-    else:
-        # Lower-value lead - nurture approach
-        subject = "Resources for your automation journey"
-        body = f"""Hi {name},
-
-Thank you for your interest in automation solutions. It's great to see {company} exploring ways to improve efficiency.
-
-I've attached a helpful guide on "Getting Started with Sales Automation" that many companies find valuable when beginning their automation journey.
-
-If you'd like to discuss your specific needs, I'm here to help. Feel free to reply to this email or schedule a call at your convenience.
-
-Best regards,
-Alex Thompson
-Solutions Consultant
-sales@yourcompany.com"""
+    subject, body = _render_follow_up_email(_follow_up_tier(lead_score), name, company, role)
     return {
         'subject': subject,
         'body': body,
@@ -313,17 +384,22 @@ def generate_demo_timeline(form_data: Dict[str, Any], qualification: Dict[str, A
     ]
 
 
+def _interaction_timeline_step(interaction: Dict[str, Any]) -> Dict[str, Any]:
+    """Compose a readable timeline step from a stored interaction record."""
+    event_data = interaction.get("event_data", {})
+    return {
+        "action": interaction.get("event_type", "event").replace("_", " ").title(),
+        "details": event_data.get("reasoning") or event_data.get("next_action") or str(event_data),
+        "timestamp": interaction.get("timestamp", ""),
+    } | {field: event_data[field] for field in _TIMELINE_STEP_FIELDS if field in event_data}
+
+
 def display_qualification_results(lead_id: str, form_data: dict, result):
     # Header Card
-    st.markdown(f"""
-    <div style="background: #f8f9fa; border-radius: 12px; padding: 24px; margin-bottom: 16px; box-shadow: 0 2px 8px #e9ecef;">
-      <div style="display: flex; align-items: center;">
-        <div style="font-size: 2.2em; font-weight: bold; margin-right: 16px;">{form_data.get('name', 'Lead')}</div>
-        <div style="font-size: 1.2em; color: #6c757d;">{form_data.get('company', '')}</div>
-        <span style="margin-left: auto; background: #e0f7fa; color: #00796b; border-radius: 8px; padding: 4px 12px; font-size: 0.9em;">Qualified by AI</span>
-      </div>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(
+        _HEADER_TEMPLATE.format(name=form_data.get('name', 'Lead'), company=form_data.get('company', '')),
+        unsafe_allow_html=True,
+    )
 
     # Key Metrics
     col1, col2, col3, col4 = st.columns([2, 2, 2, 2])
@@ -336,12 +412,15 @@ def display_qualification_results(lead_id: str, form_data: dict, result):
     disposition = str(disposition_val).title() if disposition_val else "Unknown"
     confidence = getattr(result, "confidence", 0)
     urgency_val = getattr(result, "urgency", None)
-    valid_urgencies = ["Low", "Medium", "High", "Urgent"]
-    if not urgency_val or str(urgency_val).strip().lower() == "not specified" or str(urgency_val).title() not in valid_urgencies:
+    # "Not specified" titles to "Not Specified", which isn't in the set either
+    urgency = str(urgency_val).title() if urgency_val else ""
+    if urgency not in _VALID_URGENCIES:
         urgency = "Not specified"
-    else:
-        urgency = str(urgency_val).title()
     next_action = getattr(result, "next_action", "N/A")
+    signals = getattr(result, "signals", None)
+    conf_impr = getattr(result, "confidence_improvements", None)
+    qualification = getattr(result, "qualification", None)
+    email = getattr(result, "email", None)
 
     with col1:
         st.metric("Lead Score", f"{score}/100")
@@ -356,12 +435,7 @@ def display_qualification_results(lead_id: str, form_data: dict, result):
             st.warning("AI is less certain about this lead.")
 
     # Action Row
-    st.markdown(f"""
-    <div style="margin: 16px 0; padding: 12px; background: #e3f2fd; border-radius: 8px;">
-      <b>Next Action:</b> <span style="font-size:1.1em;">{next_action}</span>
-      <span style="margin-left: 16px; background: #fff3e0; color: #ef6c00; border-radius: 6px; padding: 2px 10px;">Urgency: {urgency}</span>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_ACTION_ROW_TEMPLATE.format(next_action=next_action, urgency=urgency), unsafe_allow_html=True)
 
     if urgency == "Not specified":
         st.info("To improve AI confidence, provide more details about the lead's timeline or urgency in the message.")
@@ -373,17 +447,14 @@ def display_qualification_results(lead_id: str, form_data: dict, result):
     with st.expander("🧠 Why did the AI qualify this lead this way?"):
         st.write(result.reasoning)
         # Show signals/factors as chips if available
-        signals = getattr(result, "signals", None)
         if signals:
-            st.markdown("**Key Signals / Factors:**", unsafe_allow_html=True)
-            chip_html = "".join([
-                f"<span style='display:inline-block;background:#e0f2f1;color:#00695c;border-radius:16px;padding:4px 14px;margin:2px 6px 2px 0;font-size:0.98em;font-weight:500;box-shadow:0 1px 3px #e0e0e0;'>{s}</span>"
-                for s in signals if s
-            ])
-            st.markdown(f"<div style='margin-bottom:8px'>{chip_html}</div>", unsafe_allow_html=True)
+            # Label and chips go out as one element
+            chip_html = "".join([_SIGNAL_CHIP_TEMPLATE.format(signal=s) for s in signals if s])
+            st.markdown(
+                f"**Key Signals / Factors:**\n\n<div style='margin-bottom:8px'>{chip_html}</div>",
+                unsafe_allow_html=True
+            )
         # Show confidence improvements if confidence is low
-        confidence = getattr(result, "confidence", 0)
-        conf_impr = getattr(result, "confidence_improvements", None)
         if confidence < 60 and conf_impr:
             st.markdown(
                 f"<div style='margin-top:8px;padding:10px 16px;background:#fff3e0;border-radius:8px;color:#ef6c00;'><b>What would improve AI confidence?</b><br>{conf_impr if isinstance(conf_impr, str) else ', '.join(conf_impr)}</div>",
@@ -398,7 +469,6 @@ def display_qualification_results(lead_id: str, form_data: dict, result):
     # ... (existing CRM/timeline/email display code) ...
     
     # Agent reasoning section
-    qualification = getattr(result, "qualification", None)
     if qualification is not None:
         display_agent_reasoning(qualification)
     
@@ -407,29 +477,11 @@ def display_qualification_results(lead_id: str, form_data: dict, result):
     interactions = memory_manager.get_interaction_history(lead_id)
     if interactions:
         # Convert interaction records to timeline steps for display_agent_timeline
-        timeline_steps = []
-        for interaction in interactions:
-            event_type = interaction.get("event_type", "event")
-            event_data = interaction.get("event_data", {})
-            timestamp = interaction.get("timestamp", "")
-            # Compose a readable step
-            step = {
-                "action": event_type.replace("_", " ").title(),
-                "details": event_data.get("reasoning") or event_data.get("next_action") or str(event_data),
-                "timestamp": timestamp
-            }
-            # Add key fields if present
-            if "lead_score" in event_data:
-                step["lead_score"] = event_data["lead_score"]
-            if "priority" in event_data:
-                step["priority"] = event_data["priority"]
-            timeline_steps.append(step)
-        display_agent_timeline(timeline_steps)
+        display_agent_timeline([_interaction_timeline_step(interaction) for interaction in interactions])
     else:
         st.info("No interaction history yet for this lead.")
     
     # Email output section
-    email = getattr(result, "email", None)
     if email is not None:
         display_email_output(email)
     
@@ -459,7 +511,7 @@ def display_qualification_results(lead_id: str, form_data: dict, result):
     
     # Clear results button
     if st.button("🗑️ Clear Results", key="qualify_clear_results_btn"):
-        if hasattr(st.session_state, 'demo_results') and 'qualify' in st.session_state.demo_results:
+        if 'qualify' in st.session_state.get('demo_results', {}):
             st.session_state.demo_results['qualify'] = {}
         st.rerun() 
 
@@ -7,7 +7,7 @@ import streamlit as st
 from typing import Dict, Any, List
 from unittest.mock import patch, Mock
 
-from ui.state.session import get_memory_manager, store_demo_result
+from ui.state.session import get_latest_demo_result, get_memory_manager, store_demo_result
 from ui.components.agent_visualizer import display_agent_timeline
 from ui.components.email_display import display_email_output
 from agents.models import ReplyAnalysisResult
@@ -206,14 +206,13 @@ Sarah"""
         display_reply_analysis_results(lead_id, lead_data, reply_content, result)
     
     # Show previous results if any
-    elif hasattr(st.session_state, 'demo_results') and 'reply' in st.session_state.demo_results:
+    elif 'reply' in st.session_state.get('demo_results', {}):
         st.markdown("---")
         st.subheader("📋 Previous Demo Results")
         
-        results = st.session_state.demo_results['reply']
-        if results:
-            latest_lead_id = max(results.keys())
-            latest_result = results[latest_lead_id]
+        latest = get_latest_demo_result('reply')
+        if latest:
+            latest_lead_id, latest_result = latest
             
             # Handle both dict and ReplyAnalysisResult cases
             if isinstance(latest_result, dict):
@@ -692,7 +691,7 @@ def display_reply_analysis_results(lead_id: str, lead_data: Dict[str, Any], repl
 
     # Clear results button
     if st.button("🗑️ Clear Results", key="reply_clear_results_btn"):
-        if hasattr(st.session_state, 'demo_results') and 'reply' in st.session_state.demo_results:
+        if 'reply' in st.session_state.get('demo_results', {}):
             st.session_state.demo_results['reply'] = {}
         st.rerun()
 
@@ -145,8 +145,8 @@ def build_context_from_meeting_request(request_data, memory_mgr=None):
     
     return context
 
-def analyze_meeting_request(context):
-    """Analyze a meeting request using MeetingScheduler agent."""
+def analyze_meeting_request(context, llm_chain=None):
+    """Analyze a meeting request using MeetingScheduler agent, optionally with a pre-built LLM chain."""
     print("\n=== Analyzing Meeting Request ===")
     
     # Get MeetingScheduler agent
@@ -168,7 +168,7 @@ def analyze_meeting_request(context):
     
     try:
         # Run analysis using the agent
-        analysis_result = meeting_scheduler.analyze_request(request_data, lead_context)
+        analysis_result = meeting_scheduler.analyze_request(request_data, lead_context, llm_chain=llm_chain)
         
         print("\nAgent Analysis Result:")
         for key, value in analysis_result.items():